@@ -16,10 +16,10 @@ if errorlevel 1 (
 )
 
 echo [1/3] Installing dependencies...
-pip install pandas openpyxl rapidfuzz pyinstaller --quiet
+pip install pandas openpyxl xlsxwriter rapidfuzz pyinstaller --quiet
 
 echo [2/3] Building executable...
-python -m PyInstaller --noconfirm --onefile --windowed --name "BP_Duplicate_Checker" --add-data "src;src" --hidden-import=rapidfuzz --hidden-import=openpyxl --hidden-import=pandas --hidden-import=numpy main.py
+python -m PyInstaller --noconfirm --onefile --windowed --name "BP_Duplicate_Checker" --add-data "src;src" --hidden-import=rapidfuzz --hidden-import=openpyxl --hidden-import=xlsxwriter --hidden-import=pandas --hidden-import=numpy main.py
 
 echo [3/3] Cleaning up...
 rmdir /s /q build 2>nul
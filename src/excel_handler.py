@@ -11,17 +11,134 @@ Features:
 """
 
 import os
+from collections import namedtuple
+from bisect import bisect_right
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 import pandas as pd
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# Optional: xlsxwriter is faster for plain-value output
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 
 # Required columns for input Excel file
 REQUIRED_COLUMNS = ['BP_Number', 'Name1', 'Name2']
 
+# Normalized (casefolded) header -> canonical column name
+COLUMN_CANONICAL = {col.casefold(): col for col in REQUIRED_COLUMNS}
+REQUIRED_LOWER = frozenset(COLUMN_CANONICAL)
+
+
+class BPRow(namedtuple('BPRow', REQUIRED_COLUMNS)):
+    """
+    A single input row, stored as a tuple instead of a per-row dict.
+
+    Also supports dict-style lookups by column name (row['Name1'],
+    row.get('Name1', ''), 'Name1' in row, keys(), values(), items()) so
+    existing record consumers keep working. Iteration and len() are the
+    tuple's: they cover the values, so use keys() to iterate column names.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        """Membership tests column names, as for a dict."""
+        return key in self._fields
+
+    def get(self, key, default=None):
+        """Return the value for a column name, or default if unknown."""
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        """Column names, as for a dict."""
+        return self._fields
+
+    def values(self):
+        """Cell values in column order."""
+        return tuple(self)
+
+    def items(self):
+        """(column name, value) pairs, as for a dict."""
+        return list(zip(self._fields, self))
+
+
+# Export styles (immutable, so a single instance is shared by all cells)
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HIGH_SCORE_FILL = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
+MEDIUM_SCORE_FILL = PatternFill(start_color="FFE066", end_color="FFE066", fill_type="solid")
+CENTER_ALIGN = Alignment(horizontal='center')
+THIN_SIDE = Side(style='thin')
+BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+SUMMARY_TITLE_FONT = Font(bold=True, size=14)
+SUMMARY_LABEL_FONT = Font(bold=True)
+
+# Confidence levels: scores >= each threshold move up one level
+CONFIDENCE_THRESHOLDS = (60, 80)
+CONFIDENCE_LABELS = ("Low", "Medium", "High")
+CONFIDENCE_FILLS = (None, MEDIUM_SCORE_FILL, HIGH_SCORE_FILL)
+
+# Matching Results sheet layout
+RESULT_HEADERS = (
+    "Source BP Number",
+    "Source Name1",
+    "Source Name2",
+    "Match Rank",
+    "Match BP Number",
+    "Match Name1",
+    "Match Name2",
+    "Similarity Score",
+    "Confidence Level"
+)
+RESULT_COLUMN_WIDTHS = (15, 25, 25, 10, 15, 25, 25, 15, 15)
+SUMMARY_COLUMN_WIDTHS = (30, 25)
+
+# Result columns (1-based) that are center aligned
+_CENTER_COLS = frozenset({1, 4, 5, 8, 9})
+
+
+def _styled_cell(ws, value, font=None, fill=None, alignment=None, border=None) -> WriteOnlyCell:
+    """
+    Create a write-only cell with the given styles applied.
+
+    Args:
+        ws: Write-only worksheet the cell belongs to
+        value: Cell value
+        font, fill, alignment, border: Optional openpyxl styles
+
+    Returns:
+        Styled WriteOnlyCell ready to be appended
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if border is not None:
+        cell.border = border
+    return cell
+
+
+def _normalize_header(header) -> List[Optional[str]]:
+    """Strip and casefold each header name once (None for empty cells)."""
+    return [None if col is None else str(col).strip().casefold() for col in header]
+
 
 class ExcelValidationError(Exception):
     """Custom exception for Excel validation errors."""
@@ -44,27 +161,19 @@ class ExcelHandler:
         Returns:
             Tuple of (is_valid, message)
         """
-        # Check file exists
-        if not os.path.exists(file_path):
-            return False, f"File not found: {file_path}"
-
-        # Check file extension
-        if not file_path.lower().endswith(('.xlsx', '.xls')):
-            return False, "File must be an Excel file (.xlsx or .xls)"
+        error = ExcelHandler._check_file_path(file_path)
+        if error:
+            return False, error
 
         try:
             # Read only the header row to validate columns
-            df = pd.read_excel(file_path, nrows=0)
-            columns = [col.strip() for col in df.columns.tolist()]
-
-            # Check for required columns (case-insensitive)
-            columns_lower = [col.lower() for col in columns]
-            missing = []
-
-            for req_col in REQUIRED_COLUMNS:
-                if req_col.lower() not in columns_lower:
-                    missing.append(req_col)
+            rows = ExcelHandler._sheet_rows(file_path, header_only=True)
+            try:
+                header = next(rows)
+            finally:
+                rows.close()
 
+            missing = ExcelHandler._missing_columns(header)
             if missing:
                 return False, f"Missing required columns: {', '.join(missing)}"
 
@@ -74,7 +183,122 @@ class ExcelHandler:
             return False, f"Error reading file: {str(e)}"
 
     @staticmethod
-    def load_data(file_path: str) -> Tuple[List[Dict[str, str]], str]:
+    def open_and_load(file_path: str) -> Tuple[bool, str, List[BPRow]]:
+        """
+        Validate and load an Excel file while opening the workbook only once.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            Tuple of (is_valid, status message, list of records). As with
+            validate_file() followed by load_data(), is_valid is False only
+            if validation failed; load errors return an empty record list.
+        """
+        error = ExcelHandler._check_file_path(file_path)
+        if error:
+            return False, error, []
+
+        rows = ExcelHandler._sheet_rows(file_path)
+        try:
+            # The first row is the header: validate it before streaming the rest
+            try:
+                header = next(rows)
+            except Exception as e:
+                return False, f"Error reading file: {str(e)}", []
+
+            missing = ExcelHandler._missing_columns(header)
+            if missing:
+                return False, f"Missing required columns: {', '.join(missing)}", []
+
+            records = ExcelHandler._rows_to_records(header, rows)
+            return True, f"Loaded {len(records)} records successfully", records
+
+        except Exception as e:
+            return True, f"Error loading data: {str(e)}", []
+
+        finally:
+            rows.close()
+
+    @staticmethod
+    def _check_file_path(file_path: str) -> Optional[str]:
+        """
+        Check that the file exists and has an Excel extension.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            Error message, or None if the path is acceptable
+        """
+        # Check file exists
+        if not os.path.exists(file_path):
+            return f"File not found: {file_path}"
+
+        # Check file extension
+        if not file_path.lower().endswith(('.xlsx', '.xls')):
+            return "File must be an Excel file (.xlsx or .xls)"
+
+        return None
+
+    @staticmethod
+    def _missing_columns(header: List[Optional[str]]) -> List[str]:
+        """
+        Find required columns that are absent from a header row.
+
+        Args:
+            header: Header names from _normalize_header
+
+        Returns:
+            Missing column names, in REQUIRED_COLUMNS order
+        """
+        # Check for required columns (case-insensitive)
+        missing_lower = REQUIRED_LOWER.difference(header)
+
+        return [col for col in REQUIRED_COLUMNS if col.casefold() in missing_lower]
+
+    @staticmethod
+    def _sheet_rows(file_path: str, header_only: bool = False):
+        """
+        Stream the first worksheet of an Excel file.
+
+        The workbook stays open until the generator is exhausted or closed.
+
+        Args:
+            file_path: Path to the Excel file
+            header_only: Only the header row is needed
+
+        Yields:
+            The header names from _normalize_header, then one tuple of cell
+            values per data row
+        """
+        # Legacy .xls files are not supported by openpyxl
+        if file_path.lower().endswith('.xls'):
+            # Only parse the required columns
+            df = pd.read_excel(
+                file_path,
+                nrows=0 if header_only else None,
+                usecols=lambda col: str(col).strip().casefold() in COLUMN_CANONICAL
+            )
+            yield _normalize_header(df.columns)
+            yield from df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            return
+
+        # Stream rows in read-only mode instead of building a DataFrame
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            # Read-only sheets trust the stored dimension, which some writers
+            # leave stale (or just "A1"); rescan the real extent as pandas does
+            ws.reset_dimensions()
+            rows = ws.iter_rows(values_only=True)
+            yield _normalize_header(next(rows, ()))
+            yield from rows
+        finally:
+            wb.close()
+
+    @staticmethod
+    def load_data(file_path: str) -> Tuple[List[BPRow], str]:
         """
         Load BP data from an Excel file.
 
@@ -85,32 +309,54 @@ class ExcelHandler:
             Tuple of (list of records, status message)
         """
         try:
-            # Read the Excel file
-            df = pd.read_excel(file_path)
-
-            # Standardize column names (handle case variations)
-            column_mapping = {}
-            for col in df.columns:
-                col_lower = col.strip().lower()
-                if col_lower == 'bp_number':
-                    column_mapping[col] = 'BP_Number'
-                elif col_lower == 'name1':
-                    column_mapping[col] = 'Name1'
-                elif col_lower == 'name2':
-                    column_mapping[col] = 'Name2'
-
-            df = df.rename(columns=column_mapping)
-
-            # Convert to list of dictionaries
-            # Handle NaN values by converting to empty strings
-            df = df.fillna('')
-            records = df.to_dict('records')
+            rows = ExcelHandler._sheet_rows(file_path)
+            try:
+                records = ExcelHandler._rows_to_records(next(rows), rows)
+            finally:
+                rows.close()
 
             return records, f"Loaded {len(records)} records successfully"
 
         except Exception as e:
             return [], f"Error loading data: {str(e)}"
 
+    @staticmethod
+    def _rows_to_records(header: List[Optional[str]], rows) -> List[BPRow]:
+        """
+        Convert raw worksheet rows into BPRow records (BP_Number, Name1, Name2).
+
+        Args:
+            header: Header names from _normalize_header
+            rows: Iterable of row value tuples following the header
+
+        Returns:
+            List of BPRow records
+        """
+        # Locate the required columns (case-insensitive)
+        index = {}
+        for i, col in enumerate(header):
+            canonical = COLUMN_CANONICAL.get(col)
+            if canonical and canonical not in index:
+                index[canonical] = i
+
+        bp_i = index.get('BP_Number')
+        n1_i = index.get('Name1')
+        n2_i = index.get('Name2')
+
+        def value(row, i):
+            if i is None or i >= len(row) or row[i] is None:
+                return ''
+            return row[i]
+
+        records = []
+        for row in rows:
+            # Skip completely empty rows
+            if not any(v is not None for v in row):
+                continue
+            records.append(BPRow(value(row, bp_i), value(row, n1_i), value(row, n2_i)))
+
+        return records
+
     @staticmethod
     def export_results(
         results: Dict,
@@ -133,137 +379,11 @@ class ExcelHandler:
             Tuple of (success, message)
         """
         try:
-            # Create workbook
-            wb = Workbook()
-
-            # ===== Sheet 1: Matching Results =====
-            ws_results = wb.active
-            ws_results.title = "Matching Results"
-
-            # Define styles
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            high_score_fill = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
-            medium_score_fill = PatternFill(start_color="FFE066", end_color="FFE066", fill_type="solid")
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+            if xlsxwriter is not None:
+                ExcelHandler._write_results_xlsxwriter(results, output_path, summary_stats)
+            else:
+                ExcelHandler._write_results_openpyxl(results, output_path, summary_stats)
 
-            # Headers
-            headers = [
-                "Source BP Number",
-                "Source Name1",
-                "Source Name2",
-                "Match Rank",
-                "Match BP Number",
-                "Match Name1",
-                "Match Name2",
-                "Similarity Score",
-                "Confidence Level"
-            ]
-
-            for col, header in enumerate(headers, 1):
-                cell = ws_results.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = border
-
-            # Data rows
-            row_num = 2
-            for bp_number, matches in results.items():
-                if not matches:
-                    continue
-
-                for rank, match in enumerate(matches, 1):
-                    # Determine confidence level
-                    score = match.similarity_score
-                    if score >= 80:
-                        confidence = "High"
-                        score_fill = high_score_fill
-                    elif score >= 60:
-                        confidence = "Medium"
-                        score_fill = medium_score_fill
-                    else:
-                        confidence = "Low"
-                        score_fill = None
-
-                    # Write row data
-                    row_data = [
-                        match.source_bp.bp_number,
-                        match.source_bp.name1,
-                        match.source_bp.name2,
-                        rank,
-                        match.match_bp.bp_number,
-                        match.match_bp.name1,
-                        match.match_bp.name2,
-                        score,
-                        confidence
-                    ]
-
-                    for col, value in enumerate(row_data, 1):
-                        cell = ws_results.cell(row=row_num, column=col, value=value)
-                        cell.border = border
-
-                        # Highlight high/medium scores
-                        if col == 8 and score_fill:  # Similarity Score column
-                            cell.fill = score_fill
-
-                        # Center align certain columns
-                        if col in [1, 4, 5, 8, 9]:
-                            cell.alignment = Alignment(horizontal='center')
-
-                    row_num += 1
-
-            # Adjust column widths
-            column_widths = [15, 25, 25, 10, 15, 25, 25, 15, 15]
-            for col, width in enumerate(column_widths, 1):
-                ws_results.column_dimensions[
-                    ws_results.cell(row=1, column=col).column_letter
-                ].width = width
-
-            # Freeze header row
-            ws_results.freeze_panes = 'A2'
-
-            # ===== Sheet 2: Summary =====
-            ws_summary = wb.create_sheet("Summary")
-
-            summary_data = [
-                ["BP Duplicate Check - Summary Report", ""],
-                ["Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-                ["", ""],
-            ]
-
-            if summary_stats:
-                summary_data.extend([
-                    ["Total Records Analyzed", summary_stats.get('total_records', 0)],
-                    ["Records with Potential Matches", summary_stats.get('records_with_matches', 0)],
-                    ["Total Match Pairs Found", summary_stats.get('total_matches', 0)],
-                    ["Average Similarity Score", f"{summary_stats.get('average_score', 0):.2f}%"],
-                    ["", ""],
-                    ["Confidence Breakdown", ""],
-                    ["High Confidence (≥80%)", summary_stats.get('high_confidence', 0)],
-                    ["Medium Confidence (60-79%)", summary_stats.get('medium_confidence', 0)],
-                    ["Low Confidence (<60%)", summary_stats.get('low_confidence', 0)],
-                ])
-
-            for row_num, (label, value) in enumerate(summary_data, 1):
-                cell_label = ws_summary.cell(row=row_num, column=1, value=label)
-                cell_value = ws_summary.cell(row=row_num, column=2, value=value)
-
-                if row_num == 1:
-                    cell_label.font = Font(bold=True, size=14)
-                elif label and not value:
-                    cell_label.font = Font(bold=True)
-
-            ws_summary.column_dimensions['A'].width = 30
-            ws_summary.column_dimensions['B'].width = 25
-
-            # Save workbook
-            wb.save(output_path)
             return True, f"Results exported to: {output_path}"
 
         except PermissionError:
@@ -271,6 +391,226 @@ class ExcelHandler:
         except Exception as e:
             return False, f"Error exporting results: {str(e)}"
 
+    @staticmethod
+    def _result_rows(results: Dict):
+        """
+        Flatten matching results into export rows.
+
+        Args:
+            results: Dictionary of matching results from FuzzyMatcher
+
+        Yields:
+            Tuple of (row values, confidence level index)
+        """
+        thresholds = CONFIDENCE_THRESHOLDS
+        labels = CONFIDENCE_LABELS
+
+        # Single flat loop over (rank, match); empty match lists yield nothing
+        ranked = (
+            (rank, match)
+            for matches in results.values()
+            for rank, match in enumerate(matches, 1)
+        )
+
+        for rank, match in ranked:
+            src = match.source_bp
+            dst = match.match_bp
+            score = match.similarity_score
+
+            # Determine confidence level
+            level = bisect_right(thresholds, score)
+
+            yield (
+                src.bp_number, src.name1, src.name2,
+                rank,
+                dst.bp_number, dst.name1, dst.name2,
+                score,
+                labels[level]
+            ), level
+
+    @staticmethod
+    def _summary_rows(summary_stats: Optional[Dict]) -> List[list]:
+        """
+        Build the (label, value) rows of the Summary sheet.
+
+        Args:
+            summary_stats: Optional summary statistics to include
+
+        Returns:
+            List of [label, value] rows
+        """
+        summary_data = [
+            ["BP Duplicate Check - Summary Report", ""],
+            ["Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ["", ""],
+        ]
+
+        if summary_stats:
+            summary_data.extend([
+                ["Total Records Analyzed", summary_stats.get('total_records', 0)],
+                ["Records with Potential Matches", summary_stats.get('records_with_matches', 0)],
+                ["Total Match Pairs Found", summary_stats.get('total_matches', 0)],
+                ["Average Similarity Score", f"{summary_stats.get('average_score', 0):.2f}%"],
+                ["", ""],
+                ["Confidence Breakdown", ""],
+                ["High Confidence (≥80%)", summary_stats.get('high_confidence', 0)],
+                ["Medium Confidence (60-79%)", summary_stats.get('medium_confidence', 0)],
+                ["Low Confidence (<60%)", summary_stats.get('low_confidence', 0)],
+            ])
+
+        return summary_data
+
+    @staticmethod
+    def _write_results_xlsxwriter(
+        results: Dict,
+        output_path: str,
+        summary_stats: Optional[Dict] = None
+    ) -> None:
+        """
+        Write the results workbook with xlsxwriter.
+
+        constant_memory mode flushes each row to disk once the next row
+        starts, so rows must be written strictly in order. strings_to_urls
+        is off so URL-like names are written as plain text, like openpyxl.
+        """
+        wb = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'strings_to_urls': False})
+
+        # Formats are registered once and shared by all cells
+        header_fmt = wb.add_format({
+            'bold': True, 'font_color': 'white', 'bg_color': '#4472C4',
+            'align': 'center', 'border': 1
+        })
+        plain_fmt = wb.add_format({'border': 1})
+        center_fmt = wb.add_format({'border': 1, 'align': 'center'})
+        score_fmts = (
+            center_fmt,
+            wb.add_format({'border': 1, 'align': 'center', 'bg_color': '#FFE066'}),
+            wb.add_format({'border': 1, 'align': 'center', 'bg_color': '#FF6B6B'}),
+        )
+        title_fmt = wb.add_format({'bold': True, 'font_size': 14})
+        label_fmt = wb.add_format({'bold': True})
+
+        # ===== Sheet 1: Matching Results =====
+        ws_results = wb.add_worksheet("Matching Results")
+        for col, width in enumerate(RESULT_COLUMN_WIDTHS):
+            ws_results.set_column(col, col, width)
+        ws_results.freeze_panes(1, 0)
+
+        ws_results.write_row(0, 0, RESULT_HEADERS, header_fmt)
+
+        col_fmts = [
+            center_fmt if col in _CENTER_COLS else plain_fmt
+            for col in range(1, len(RESULT_HEADERS) + 1)
+        ]
+        write = ws_results.write
+
+        for row_num, (row_data, level) in enumerate(ExcelHandler._result_rows(results), 1):
+            # Highlight high/medium scores
+            col_fmts[7] = score_fmts[level]
+            for col, value in enumerate(row_data):
+                write(row_num, col, value, col_fmts[col])
+
+        # ===== Sheet 2: Summary =====
+        ws_summary = wb.add_worksheet("Summary")
+        for col, width in enumerate(SUMMARY_COLUMN_WIDTHS):
+            ws_summary.set_column(col, col, width)
+
+        for row_num, (label, value) in enumerate(ExcelHandler._summary_rows(summary_stats)):
+            if row_num == 0:
+                ws_summary.write(row_num, 0, label, title_fmt)
+            elif label and not value:
+                ws_summary.write(row_num, 0, label, label_fmt)
+            else:
+                ws_summary.write(row_num, 0, label)
+            ws_summary.write(row_num, 1, value)
+
+        try:
+            wb.close()
+        except xlsxwriter.exceptions.FileCreateError as e:
+            # Surface the underlying OS error (e.g. PermissionError)
+            raise e.args[0] from e
+
+    @staticmethod
+    def _write_results_openpyxl(
+        results: Dict,
+        output_path: str,
+        summary_stats: Optional[Dict] = None
+    ) -> None:
+        """
+        Write the results workbook with an openpyxl write-only workbook.
+
+        Used when xlsxwriter is not installed.
+        """
+        # Write-only workbook streams rows instead of keeping the grid in memory
+        wb = Workbook(write_only=True)
+
+        # ===== Sheet 1: Matching Results =====
+        ws_results = wb.create_sheet("Matching Results")
+
+        # Column widths and frozen header must be set before the first row
+        for col, width in enumerate(RESULT_COLUMN_WIDTHS, 1):
+            ws_results.column_dimensions[get_column_letter(col)].width = width
+
+        ws_results.freeze_panes = 'A2'
+
+        ws_results.append([
+            _styled_cell(ws_results, header, font=HEADER_FONT, fill=HEADER_FILL,
+                         alignment=CENTER_ALIGN, border=BORDER)
+            for header in RESULT_HEADERS
+        ])
+
+        # Resolve each (confidence level, column) style once from a prototype
+        # cell; data cells then share the resolved style array instead of
+        # re-hashing Border/Alignment/Fill on every assignment.
+        level_styles = [
+            [
+                _styled_cell(
+                    ws_results,
+                    None,
+                    # Highlight high/medium scores
+                    fill=score_fill if col == 8 else None,
+                    # Center align certain columns
+                    alignment=CENTER_ALIGN if col in _CENTER_COLS else None,
+                    border=BORDER
+                )._style
+                for col in range(1, len(RESULT_HEADERS) + 1)
+            ]
+            for score_fill in CONFIDENCE_FILLS
+        ]
+
+        # Data rows (bind hot-loop lookups to locals once)
+        append_row = ws_results.append
+        new_cell = WriteOnlyCell
+
+        for row_data, level in ExcelHandler._result_rows(results):
+            row_cells = []
+            for value, style in zip(row_data, level_styles[level]):
+                cell = new_cell(ws_results, value)
+                cell._style = style
+                row_cells.append(cell)
+            append_row(row_cells)
+
+        # ===== Sheet 2: Summary =====
+        ws_summary = wb.create_sheet("Summary")
+        for col, width in enumerate(SUMMARY_COLUMN_WIDTHS, 1):
+            ws_summary.column_dimensions[get_column_letter(col)].width = width
+
+        for row_num, (label, value) in enumerate(ExcelHandler._summary_rows(summary_stats), 1):
+            if row_num == 1:
+                label_font = SUMMARY_TITLE_FONT
+            elif label and not value:
+                label_font = SUMMARY_LABEL_FONT
+            else:
+                label_font = None
+
+            ws_summary.append([
+                _styled_cell(ws_summary, label, font=label_font),
+                value
+            ])
+
+        # Save workbook
+        wb.save(output_path)
+
 
 def create_example_input_file(output_path: str) -> Tuple[bool, str]:
     """
@@ -307,8 +647,25 @@ def create_example_input_file(output_path: str) -> Tuple[bool, str]:
             {"BP_Number": "BP020", "Name1": "Pacific Trading Enterprises", "Name2": ""},
         ]
 
-        df = pd.DataFrame(example_data)
-        df.to_excel(output_path, index=False)
+        rows = [[row[col] for col in REQUIRED_COLUMNS] for row in example_data]
+
+        if xlsxwriter is not None:
+            # xlsxwriter streams plain values much faster than openpyxl.
+            # constant_memory requires rows to be written in order.
+            wb = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+            ws = wb.add_worksheet("Sheet1")
+            ws.write_row(0, 0, REQUIRED_COLUMNS)
+            for row_num, row in enumerate(rows, 1):
+                ws.write_row(row_num, 0, row)
+            wb.close()
+        else:
+            # Fall back to an openpyxl write-only workbook
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Sheet1")
+            ws.append(REQUIRED_COLUMNS)
+            for row in rows:
+                ws.append(row)
+            wb.save(output_path)
 
         return True, f"Example file created: {output_path}"
 
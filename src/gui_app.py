@@ -17,19 +17,31 @@ import sys
 import threading
 from tkinter import (
     Tk, Frame, Label, Entry, Button, Text, Scrollbar,
-    filedialog, messagebox, StringVar, IntVar, DoubleVar,
+    filedialog, messagebox, StringVar, IntVar,
     HORIZONTAL, VERTICAL, BOTH, LEFT, RIGHT, TOP, BOTTOM,
     X, Y, END, W, E, N, S, DISABLED, NORMAL, CENTER
 )
-from tkinter import ttk
-from typing import Optional, Dict, List
+from tkinter import ttk, font as tkfont
+from typing import Optional, Dict, List, Tuple, FrozenSet
 import queue
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.matching_engine import FuzzyMatcher, MatchResult
-from src.excel_handler import ExcelHandler, create_example_input_file
+from src.excel_handler import (
+    ExcelHandler, create_example_input_file,
+    CONFIDENCE_THRESHOLDS, CONFIDENCE_LABELS
+)
+
+
+def _numeric_sort_key(value) -> float:
+    """Parse a numeric cell value such as '85.3%' for sorting (0 if not numeric)."""
+    try:
+        return float(str(value).replace('%', '').strip())
+    except ValueError:
+        return 0
 
 
 class BPDuplicateCheckerApp:
@@ -45,6 +57,21 @@ class BPDuplicateCheckerApp:
     MIN_WIDTH = 900
     MIN_HEIGHT = 500
 
+    # Compare modes: label -> extra FuzzyMatcher.find_matches() arguments.
+    # The quick modes skip pairs that are unlikely to match (faster on large
+    # files, but may miss some duplicates)
+    COMPARE_MODES = {
+        'All pairs': {},
+        'Quick: same first 2 letters': {'block_prefix': 2},
+        'Quick: sharing a word': {'shared_word': True},
+    }
+
+    # Rows scrolled per mouse-wheel notch
+    WHEEL_ROWS = 3
+
+    # Treeview row tags, indexed by confidence level (see CONFIDENCE_THRESHOLDS)
+    CONFIDENCE_TAGS = ('low', 'medium', 'high')
+
     # Default ignore words
     DEFAULT_IGNORE_WORDS = "Mrs, Ms, Mr, Dr, Prof, Company, Co, Ltd, LLC, Inc, Corp, Limited"
 
@@ -62,12 +89,25 @@ class BPDuplicateCheckerApp:
         self.setup_bindings()
 
         # Data storage
-        self.loaded_data: List[Dict] = []
+        self.loaded_data: List = []
         self.matching_results: Dict = {}
         self.matcher: Optional[FuzzyMatcher] = None
 
+        # Last parsed ignore-word text and its word set
+        self._ignore_cache: Tuple[str, FrozenSet[str]] = ('', frozenset())
+        # Data list and ignore words the current matcher was loaded with
+        self._matcher_source: Optional[Tuple[List, FrozenSet[str]]] = None
+
+        # Virtual results view: the treeview only holds the visible rows
+        self._view_rows: List[tuple] = []  # (values, tag) for every result row
+        self._row_order = np.arange(0)  # display order as indexes into _view_rows
+        self._view_top = 0  # display position of the first visible row
+        self._visible_rows = 20  # rows that fit in the treeview (updated on resize)
+        self._selected_row: Optional[int] = None  # index into _view_rows
+        self._sort_keys: Dict[str, np.ndarray] = {}
+
         # Thread-safe queue for progress updates
-        self.progress_queue = queue.Queue()
+        self.progress_queue = queue.SimpleQueue()
 
     def setup_window(self):
         """Configure the main window properties."""
@@ -97,9 +137,9 @@ class BPDuplicateCheckerApp:
         self.file_path_var = StringVar()
         self.ignore_words_var = StringVar(value=self.DEFAULT_IGNORE_WORDS)
         self.status_var = StringVar(value="Ready. Please upload an Excel file to begin.")
-        self.progress_var = DoubleVar(value=0)
         self.min_score_var = IntVar(value=50)
         self.top_n_var = IntVar(value=3)
+        self.compare_mode_var = StringVar(value=next(iter(self.COMPARE_MODES)))
 
     def create_widgets(self):
         """Create all UI widgets."""
@@ -207,6 +247,19 @@ class BPDuplicateCheckerApp:
         )
         self.top_n_spin.pack(side=LEFT, padx=(5, 20))
 
+        # Compare mode
+        compare_label = ttk.Label(options_frame, text="Compare:")
+        compare_label.pack(side=LEFT)
+
+        self.compare_mode_combo = ttk.Combobox(
+            options_frame,
+            values=list(self.COMPARE_MODES),
+            state='readonly',
+            width=28,
+            textvariable=self.compare_mode_var
+        )
+        self.compare_mode_combo.pack(side=LEFT, padx=(5, 20))
+
         # Run button
         self.run_btn = ttk.Button(
             options_frame,
@@ -256,7 +309,6 @@ class BPDuplicateCheckerApp:
         self.progress_bar = ttk.Progressbar(
             status_frame,
             mode='determinate',
-            variable=self.progress_var,
             length=200
         )
         self.progress_bar.pack(side=RIGHT)
@@ -291,7 +343,8 @@ class BPDuplicateCheckerApp:
             table_frame,
             columns=columns,
             show='headings',
-            selectmode='browse'
+            selectmode='browse',
+            displaycolumns=columns
         )
 
         # Configure columns
@@ -309,16 +362,16 @@ class BPDuplicateCheckerApp:
 
         for col, (heading, width, anchor) in column_config.items():
             self.results_tree.heading(col, text=heading, command=lambda c=col: self.sort_column(c))
-            self.results_tree.column(col, width=width, anchor=anchor, minwidth=50)
+            self.results_tree.column(col, width=width, anchor=anchor, minwidth=50, stretch=False)
 
-        # Scrollbars
-        v_scroll = ttk.Scrollbar(table_frame, orient=VERTICAL, command=self.results_tree.yview)
+        # Scrollbars (vertical scrolling moves the virtual view, see _render_view)
+        self.v_scroll = ttk.Scrollbar(table_frame, orient=VERTICAL, command=self._on_tree_scroll)
         h_scroll = ttk.Scrollbar(table_frame, orient=HORIZONTAL, command=self.results_tree.xview)
-        self.results_tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.results_tree.configure(xscrollcommand=h_scroll.set)
 
         # Grid layout
         self.results_tree.grid(row=0, column=0, sticky='nsew')
-        v_scroll.grid(row=0, column=1, sticky='ns')
+        self.v_scroll.grid(row=0, column=1, sticky='ns')
         h_scroll.grid(row=1, column=0, sticky='ew')
 
         table_frame.grid_rowconfigure(0, weight=1)
@@ -329,6 +382,18 @@ class BPDuplicateCheckerApp:
         self.results_tree.tag_configure('medium', background='#fff3cd')
         self.results_tree.tag_configure('low', background='#ffffff')
 
+        # Virtual view events
+        self.results_tree.bind('<Configure>', self._on_tree_resize)
+        self.results_tree.bind('<MouseWheel>', self._on_tree_wheel)
+        self.results_tree.bind('<Button-4>', self._on_tree_wheel)
+        self.results_tree.bind('<Button-5>', self._on_tree_wheel)
+        self.results_tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.results_tree.bind('<Double-1>', self._on_tree_double_click)
+        self.results_tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.results_tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.results_tree.bind('<Prior>', lambda e: self._move_selection(-self._visible_rows))
+        self.results_tree.bind('<Next>', lambda e: self._move_selection(self._visible_rows))
+
     def setup_bindings(self):
         """Set up keyboard and event bindings."""
         self.root.bind('<Control-o>', lambda e: self.browse_file())
@@ -356,18 +421,18 @@ class BPDuplicateCheckerApp:
         Args:
             file_path: Path to the Excel file
         """
-        self.update_status("Validating file...")
+        self.update_status("Loading file...")
+        self.root.update_idletasks()  # show the status before the synchronous load
 
-        # Validate file
-        is_valid, message = ExcelHandler.validate_file(file_path)
+        # Validate and load data in a single pass over the workbook
+        is_valid, load_message, records = ExcelHandler.open_and_load(file_path)
 
         if not is_valid:
-            messagebox.showerror("Validation Error", message)
+            messagebox.showerror("Validation Error", load_message)
             self.update_status("File validation failed")
             return
 
-        # Load data
-        self.loaded_data, load_message = ExcelHandler.load_data(file_path)
+        self.loaded_data = records
 
         if not self.loaded_data:
             messagebox.showerror("Load Error", load_message)
@@ -392,22 +457,22 @@ class BPDuplicateCheckerApp:
             return
 
         # Parse ignore words
-        ignore_text = self.ignore_words_var.get()
-        ignore_words = [word.strip() for word in ignore_text.split(',') if word.strip()]
+        ignore_words = self._parse_ignore_words(self.ignore_words_var.get())
 
         # Get options
         min_score = self.min_score_var.get()
         top_n = self.top_n_var.get()
+        match_options = self.COMPARE_MODES[self.compare_mode_var.get()]
 
         # Disable UI during processing
         self.set_ui_state(False)
-        self.progress_var.set(0)
+        self.progress_bar['value'] = 0
         self.update_status("Running fuzzy matching...")
 
         # Run matching in background thread
         thread = threading.Thread(
             target=self.matching_worker,
-            args=(ignore_words, min_score, top_n),
+            args=(ignore_words, min_score, top_n, match_options),
             daemon=True
         )
         thread.start()
@@ -415,30 +480,60 @@ class BPDuplicateCheckerApp:
         # Start progress monitoring
         self.root.after(100, self.check_progress)
 
-    def matching_worker(self, ignore_words: List[str], min_score: int, top_n: int):
+    def _parse_ignore_words(self, ignore_text: str) -> FrozenSet[str]:
+        """
+        Parse the comma-separated ignore words, reusing the last result if unchanged.
+
+        Args:
+            ignore_text: Raw text from the ignore words entry
+
+        Returns:
+            Set of lowercase ignore words
+        """
+        cached_text, cached_words = self._ignore_cache
+        if ignore_text != cached_text:
+            cached_words = frozenset(
+                word.strip().lower() for word in ignore_text.split(',') if word.strip()
+            )
+            self._ignore_cache = (ignore_text, cached_words)
+        return cached_words
+
+    def matching_worker(self, ignore_words: FrozenSet[str], min_score: int, top_n: int,
+                        match_options: Optional[Dict] = None):
         """
         Background worker for fuzzy matching.
 
         Args:
-            ignore_words: List of words to ignore
+            ignore_words: Set of words to ignore
             min_score: Minimum similarity score threshold
             top_n: Number of top matches to return
+            match_options: Extra find_matches() arguments of the compare mode
         """
         try:
-            # Create matcher with ignore words
-            self.matcher = FuzzyMatcher(ignore_words)
-            self.matcher.load_records(self.loaded_data)
+            # Reuse the loaded matcher (and its normalized names) when neither
+            # the data nor the ignore words changed since the last run
+            source = self._matcher_source
+            if source is None or source[0] is not self.loaded_data or source[1] != ignore_words:
+                self.matcher = FuzzyMatcher(ignore_words)
+                self.matcher.load_records(self.loaded_data)
+                self._matcher_source = (self.loaded_data, ignore_words)
+
+            # Progress callback (only queue a message when the whole percent changes)
+            last_pct = -1
 
-            # Progress callback
             def progress_callback(current, total):
-                progress = (current / total) * 100
-                self.progress_queue.put(('progress', progress))
+                nonlocal last_pct
+                pct = int(current * 100 / total)
+                if pct != last_pct:
+                    last_pct = pct
+                    self.progress_queue.put(('progress', pct))
 
             # Run matching
             self.matching_results = self.matcher.find_matches(
                 top_n=top_n,
                 min_score=min_score,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                **(match_options or {})
             )
 
             # Signal completion
@@ -449,15 +544,17 @@ class BPDuplicateCheckerApp:
 
     def check_progress(self):
         """Check progress queue and update UI."""
+        # Drain the queue but only apply the most recent progress value
+        latest = None
         try:
             while True:
                 msg_type, data = self.progress_queue.get_nowait()
 
                 if msg_type == 'progress':
-                    self.progress_var.set(data)
+                    latest = data
 
                 elif msg_type == 'complete':
-                    self.progress_var.set(100)
+                    self.progress_bar['value'] = 100
                     self.display_results()
                     self.set_ui_state(True)
                     return
@@ -471,53 +568,50 @@ class BPDuplicateCheckerApp:
         except queue.Empty:
             pass
 
+        if latest is not None:
+            self.progress_bar['value'] = latest
+
         # Continue checking
         self.root.after(100, self.check_progress)
 
     def display_results(self):
         """Display matching results in the treeview."""
-        # Clear existing results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-
-        # Count total matches
-        total_matches = 0
-        records_with_matches = 0
-
-        # Insert results
-        for bp_number, matches in self.matching_results.items():
-            if not matches:
-                continue
-
-            records_with_matches += 1
-
-            for rank, match in enumerate(matches, 1):
-                total_matches += 1
-                score = match.similarity_score
-
-                # Determine confidence level and tag
-                if score >= 80:
-                    confidence = "High"
-                    tag = 'high'
-                elif score >= 60:
-                    confidence = "Medium"
-                    tag = 'medium'
-                else:
-                    confidence = "Low"
-                    tag = 'low'
-
-                # Insert row
-                self.results_tree.insert('', 'end', values=(
-                    match.source_bp.bp_number,
-                    match.source_bp.name1,
-                    match.source_bp.name2,
+        rows = []
+        results = [matches for matches in self.matching_results.values() if matches]
+        records_with_matches = len(results)
+
+        # Confidence level (index into CONFIDENCE_LABELS) of every match at once
+        scores = np.fromiter(
+            (match.similarity_score for matches in results for match in matches), dtype=float
+        )
+        levels = iter(np.digitize(scores, CONFIDENCE_THRESHOLDS).tolist())
+
+        # Local aliases for the loop below
+        append = rows.append
+        labels = CONFIDENCE_LABELS
+        tags = self.CONFIDENCE_TAGS
+
+        for matches in results:
+            source = matches[0].source_bp
+            source_values = (source.bp_number, source.name1, source.name2)
+
+            for (rank, match), level in zip(enumerate(matches, 1), levels):
+                match_bp = match.match_bp
+
+                append((source_values + (
                     rank,
-                    match.match_bp.bp_number,
-                    match.match_bp.name1,
-                    match.match_bp.name2,
-                    f"{score:.1f}%",
-                    confidence
-                ), tags=(tag,))
+                    match_bp.bp_number,
+                    match_bp.name1,
+                    match_bp.name2,
+                    f"{match.similarity_score:.1f}%",
+                    labels[level]
+                ), tags[level]))
+
+        total_matches = len(rows)
+        self._set_view_rows(rows)
+
+        # Measure the real row height once the rows have been drawn
+        self.root.after_idle(self._measure_view)
 
         # Update UI
         self.result_count_label.config(
@@ -527,6 +621,201 @@ class BPDuplicateCheckerApp:
         self.clear_btn.config(state=NORMAL)
         self.update_status(f"Matching complete. Found {total_matches} potential duplicates.")
 
+    def _set_view_rows(self, rows: List[tuple]):
+        """
+        Replace the rows behind the virtual results view.
+
+        Args:
+            rows: (values, tag) tuple per result row
+        """
+        self._view_rows = rows
+        self._view_top = 0
+        self._selected_row = None
+        self._cache_sort_keys([values for values, tag in rows])
+        self._render_view()
+
+    def _render_view(self):
+        """Fill the treeview with the rows of the current viewport."""
+        tree = self.results_tree
+        total = len(self._row_order)
+        top = max(0, min(self._view_top, total - self._visible_rows))
+        count = min(self._visible_rows, total - top)
+        self._view_top = top
+
+        # Reuse the existing items as row slots, adding or removing as needed
+        slots = list(tree.get_children())
+        if len(slots) > count:
+            tree.delete(*slots[count:])
+            del slots[count:]
+        while len(slots) < count:
+            slots.append(tree.insert('', 'end'))
+
+        selected_slot = None
+        rows = self._view_rows
+        for slot, row_index in zip(slots, self._row_order[top:top + count]):
+            values, tag = rows[row_index]
+            tree.item(slot, values=values, tags=(tag,))
+            if row_index == self._selected_row:
+                selected_slot = slot
+
+        # Keep the selection on the same result row while scrolling
+        if selected_slot is not None:
+            tree.selection_set(selected_slot)
+            tree.focus(selected_slot)
+        elif tree.selection():
+            tree.selection_remove(*tree.selection())
+
+        if total:
+            self.v_scroll.set(top / total, (top + count) / total)
+        else:
+            self.v_scroll.set(0, 1)
+
+    def _scroll_view(self, rows: int):
+        """
+        Scroll the virtual view.
+
+        Args:
+            rows: Number of rows to scroll (negative scrolls up)
+        """
+        self._view_top += rows
+        self._render_view()
+
+    def _measure_view(self, height: Optional[int] = None):
+        """
+        Work out how many rows fit in the treeview and re-render if it changed.
+
+        Args:
+            height: Treeview height in pixels (queried if not given)
+        """
+        tree = self.results_tree
+        if height is None:
+            height = tree.winfo_height()
+        if height <= 1:
+            # Not laid out yet; the <Configure> binding measures again later
+            return
+
+        slots = tree.get_children()
+        bbox = tree.bbox(slots[0]) if slots else ''
+        if bbox:
+            x, y, width, row_height = bbox
+        else:
+            # Not drawn yet: estimate with one row's worth of heading
+            row_height = int(self.style.lookup('Treeview', 'rowheight') or 20)
+            y = row_height
+
+        visible = max(1, (height - y) // row_height)
+        if visible != self._visible_rows:
+            self._visible_rows = visible
+            self._render_view()
+
+    def _on_tree_resize(self, event):
+        """Handle treeview resizes."""
+        self._measure_view(event.height)
+
+    def _on_tree_scroll(self, action: str, amount: str, unit: Optional[str] = None):
+        """
+        Handle vertical scrollbar commands.
+
+        Args:
+            action: 'moveto' or 'scroll'
+            amount: Fraction for 'moveto', step count for 'scroll'
+            unit: 'units' or 'pages' for 'scroll'
+        """
+        if action == 'moveto':
+            self._view_top = int(float(amount) * len(self._row_order))
+            self._render_view()
+        elif action == 'scroll':
+            rows = int(amount)
+            if unit == 'pages':
+                rows *= self._visible_rows
+            self._scroll_view(rows)
+
+    def _on_tree_wheel(self, event):
+        """Scroll the virtual view with the mouse wheel."""
+        if event.num == 4 or (event.num != 5 and event.delta > 0):
+            self._scroll_view(-self.WHEEL_ROWS)
+        else:
+            self._scroll_view(self.WHEEL_ROWS)
+        return 'break'
+
+    def _on_tree_select(self, event):
+        """Remember which result row is selected."""
+        selection = self.results_tree.selection()
+        if selection:
+            pos = self._view_top + self.results_tree.index(selection[0])
+            self._selected_row = int(self._row_order[pos])
+
+    def _move_selection(self, step: int):
+        """
+        Move the selection by a number of rows, scrolling the view as needed.
+
+        Args:
+            step: Rows to move (negative moves up)
+        """
+        total = len(self._row_order)
+        if not total:
+            return 'break'
+
+        if self._selected_row is None:
+            pos = self._view_top
+        else:
+            current = int(np.flatnonzero(self._row_order == self._selected_row)[0])
+            pos = max(0, min(current + step, total - 1))
+
+        # Scroll just enough to keep the selected row visible
+        if pos < self._view_top:
+            self._view_top = pos
+        elif pos >= self._view_top + self._visible_rows:
+            self._view_top = pos - self._visible_rows + 1
+
+        self._selected_row = int(self._row_order[pos])
+        self._render_view()
+        return 'break'
+
+    def _on_tree_double_click(self, event):
+        """Autosize a column when its heading separator is double-clicked."""
+        tree = self.results_tree
+        if tree.identify_region(event.x, event.y) != 'separator':
+            return
+        col = tree.identify_column(event.x)
+        if col:
+            self._autosize_column(tree['displaycolumns'][int(col[1:]) - 1])
+        return 'break'
+
+    def _autosize_column(self, col: str):
+        """
+        Fit a column's width to its heading and values.
+
+        Args:
+            col: Column identifier to resize
+        """
+        tree = self.results_tree
+        measure = tkfont.nametofont('TkDefaultFont').measure
+        col_index = list(tree['columns']).index(col)
+
+        # Measure each distinct value once
+        texts = {str(values[col_index]) for values, tag in self._view_rows}
+        texts.add(tree.heading(col, 'text'))
+        width = max(measure(text) for text in texts) + 20
+        tree.column(col, width=max(width, 50))
+
+    def _cache_sort_keys(self, rows: List[tuple]):
+        """
+        Cache per-column sort keys as NumPy arrays so sorting needs no Tcl reads.
+
+        Args:
+            rows: Row values in insertion order
+        """
+        self._row_order = np.arange(len(rows))
+        self._sort_keys = {}
+
+        for col, values in zip(self.results_tree['columns'], zip(*rows)):
+            if col in ('rank', 'score'):
+                # Extract numeric value for sorting
+                self._sort_keys[col] = np.array([_numeric_sort_key(v) for v in values], dtype=float)
+            else:
+                self._sort_keys[col] = np.array([str(v).lower() for v in values])
+
     def sort_column(self, col: str):
         """
         Sort treeview by column.
@@ -534,28 +823,21 @@ class BPDuplicateCheckerApp:
         Args:
             col: Column identifier to sort by
         """
-        # Get all items
-        items = [(self.results_tree.set(item, col), item) for item in self.results_tree.get_children()]
-
         # Determine sort order (toggle)
         reverse = getattr(self, f'_sort_{col}_reverse', False)
 
-        # Sort - handle numeric columns specially
-        if col in ('rank', 'score'):
-            # Extract numeric value for sorting
-            def sort_key(x):
-                val = x[0].replace('%', '').strip()
-                try:
-                    return float(val)
-                except ValueError:
-                    return 0
-            items.sort(key=sort_key, reverse=reverse)
-        else:
-            items.sort(key=lambda x: x[0].lower(), reverse=reverse)
-
-        # Rearrange items
-        for index, (val, item) in enumerate(items):
-            self.results_tree.move(item, '', index)
+        keys = self._sort_keys.get(col)
+        if keys is not None:
+            # Stable sort of the current display order
+            current = keys[self._row_order]
+            if reverse:
+                # Sort the reversed keys and flip back so ties keep their order
+                order = np.argsort(current[::-1], kind='stable')
+                order = (len(order) - 1 - order)[::-1]
+            else:
+                order = np.argsort(current, kind='stable')
+            self._row_order = self._row_order[order]
+            self._render_view()
 
         # Toggle sort order for next time
         setattr(self, f'_sort_{col}_reverse', not reverse)
@@ -578,6 +860,7 @@ class BPDuplicateCheckerApp:
             return
 
         self.update_status("Exporting results...")
+        self.root.update_idletasks()  # show the status before the synchronous export
 
         # Get summary statistics
         summary_stats = self.matcher.get_summary_stats(self.matching_results) if self.matcher else None
@@ -598,14 +881,12 @@ class BPDuplicateCheckerApp:
 
     def clear_results(self):
         """Clear all results from the display."""
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-
+        self._set_view_rows([])
         self.matching_results = {}
         self.result_count_label.config(text="")
         self.export_btn.config(state=DISABLED)
         self.clear_btn.config(state=DISABLED)
-        self.progress_var.set(0)
+        self.progress_bar['value'] = 0
         self.update_status("Results cleared")
 
     def set_ui_state(self, enabled: bool):
@@ -620,6 +901,7 @@ class BPDuplicateCheckerApp:
         self.ignore_entry.config(state=state)
         self.min_score_spin.config(state=state)
         self.top_n_spin.config(state=state)
+        self.compare_mode_combo.config(state='readonly' if enabled else DISABLED)
 
     def update_status(self, message: str):
         """
@@ -629,7 +911,6 @@ class BPDuplicateCheckerApp:
             message: Status message to display
         """
         self.status_var.set(message)
-        self.root.update_idletasks()
 
     def show_help(self):
         """Display help dialog."""
@@ -643,6 +924,16 @@ USAGE:
    - Ignore Words: Words to exclude from comparison
    - Minimum Score: Only show matches above this threshold
    - Top N Matches: Number of matches to show per BP
+   - Compare: Which pairs of names are scored
+       All pairs: every name against every other name
+       Quick: same first 2 letters: only names that start with
+         the same two letters. Much faster on large files, but
+         misses duplicates that differ in their first letters
+       Quick: sharing a word: only names with a word in common.
+         Faster on large files, but misses duplicates that differ
+         in every word. When many names share a word (such as
+         "Trading"), all pairs are compared instead, which is no
+         faster than All pairs
 
 3. Click 'Run Matching' to find duplicates
 
@@ -13,11 +13,30 @@ Key features:
 
 import re
 import string
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable
 from dataclasses import dataclass
+import numpy as np
 from rapidfuzz import fuzz, process
 
 
+# Anything that is not a word character or whitespace counts as punctuation
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Same folding as lower() + _PUNCT_RE for ASCII text, in a single translate() pass
+_ASCII_FOLD = {
+    code: ' ' if _PUNCT_RE.match(chr(code)) else chr(code).lower()
+    for code in range(128)
+    if _PUNCT_RE.match(chr(code)) or chr(code).isupper()
+}
+
+
+def _fold(text: str) -> str:
+    """Lowercase text and replace punctuation with spaces."""
+    if text.isascii():
+        return text.translate(_ASCII_FOLD)
+    return _PUNCT_RE.sub(' ', text.lower())
+
+
 @dataclass
 class BPRecord:
     """
@@ -29,10 +48,13 @@ class BPRecord:
         name2: Secondary name field (can be empty)
         combined_name: Normalized combination of name1 and name2
     """
+    # One instance per loaded row: no per-instance __dict__. combined_name
+    # is derived in __post_init__, so it is a slot rather than a field.
+    __slots__ = ('bp_number', 'name1', 'name2', 'combined_name')
+
     bp_number: str
     name1: str
     name2: str
-    combined_name: str = ""
 
     def __post_init__(self):
         """Combine name1 and name2 after initialization."""
@@ -49,6 +71,9 @@ class MatchResult:
         match_bp: The potentially duplicate BP
         similarity_score: Score from 0-100 indicating similarity
     """
+    # One instance per reported match: no per-instance __dict__
+    __slots__ = ('source_bp', 'match_bp', 'similarity_score')
+
     source_bp: BPRecord
     match_bp: BPRecord
     similarity_score: float
@@ -73,19 +98,22 @@ class TextNormalizer:
         'the', 'and', '&'
     }
 
-    def __init__(self, ignore_words: Optional[List[str]] = None):
+    def __init__(self, ignore_words: Optional[Iterable[str]] = None):
         """
         Initialize the normalizer with optional custom ignore words.
 
         Args:
-            ignore_words: List of words to exclude from comparison.
+            ignore_words: Words to exclude from comparison (list or set).
                          If None, uses default list.
         """
         if ignore_words is not None:
             # Convert user-provided words to lowercase set
-            self.ignore_words = {word.lower().strip() for word in ignore_words if word.strip()}
+            self.ignore_words = frozenset(word.lower().strip() for word in ignore_words if word.strip())
         else:
-            self.ignore_words = self.DEFAULT_IGNORE_WORDS.copy()
+            self.ignore_words = frozenset(self.DEFAULT_IGNORE_WORDS)
+
+        # Raw text -> normalized text (company names repeat a lot in BP data)
+        self._cache: Dict[str, str] = {}
 
     def normalize(self, text: str) -> str:
         """
@@ -100,12 +128,13 @@ class TextNormalizer:
         if not text:
             return ""
 
-        # Step 1: Convert to lowercase
-        normalized = text.lower()
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
 
-        # Step 2: Remove punctuation (replace with spaces to preserve word boundaries)
-        # Keep alphanumeric and spaces only
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
+        # Step 1+2: Convert to lowercase and remove punctuation
+        # (replace with spaces to preserve word boundaries, keep alphanumeric and spaces only)
+        normalized = _fold(text)
 
         # Step 3: Split into words
         words = normalized.split()
@@ -114,9 +143,39 @@ class TextNormalizer:
         words = [word for word in words if word not in self.ignore_words]
 
         # Step 5: Rejoin and collapse multiple spaces
-        normalized = ' '.join(words)
+        normalized = ' '.join(words).strip()
 
-        return normalized.strip()
+        self._cache[text] = normalized
+        return normalized
+
+    def normalize_many(self, texts: List[str]) -> List[str]:
+        """
+        Normalize a batch of texts.
+
+        Gives the same result as normalize() on each text, but binds the
+        folding and ignore-word lookups once for the whole batch and only
+        normalizes each distinct text once.
+
+        Args:
+            texts: Raw texts to normalize
+
+        Returns:
+            List of normalized text strings
+        """
+        fold = _fold
+        ignore_words = self.ignore_words
+        cache = self._cache
+
+        missing = [text for text in dict.fromkeys(texts) if text not in cache]
+        cache.update(zip(missing, [
+            ' '.join(
+                word for word in fold(text).split()
+                if word not in ignore_words
+            ) if text else ''
+            for text in missing
+        ]))
+
+        return [cache[text] for text in texts]
 
 
 class FuzzyMatcher:
@@ -127,49 +186,78 @@ class FuzzyMatcher:
     multiple scoring algorithms combined for better accuracy.
     """
 
-    def __init__(self, ignore_words: Optional[List[str]] = None):
+    # Upper bound on score-matrix cells computed per block of source rows
+    BLOCK_CELLS = 2_000_000
+
+    # Score token_set_ratio pair by pair (cpdist) instead of for the whole
+    # block (cdist) when at most this fraction of the pairs can still match;
+    # cpdist costs about 3x more per pair
+    PAIRWISE_MAX_FRACTION = 0.25
+
+    # Fold only the passing pairs of a block into the running top-N (sorted)
+    # instead of partitioning the whole block when at most this fraction pass
+    SPARSE_MAX_FRACTION = 0.1
+
+    # Upper bound on candidate pairs generated and scored at once in the
+    # shared-word mode; a pair holds far more memory than a matrix cell
+    BLOCK_PAIRS = 250_000
+
+    # The shared-word mode scores the whole group instead when more than this
+    # fraction of its pairs share a word: pair by pair, scoring costs about
+    # 10x more per pair than for a whole block
+    SHARED_WORD_MAX_FRACTION = 0.1
+
+    def __init__(self, ignore_words: Optional[Iterable[str]] = None):
         """
         Initialize the matcher with optional ignore words.
 
         Args:
-            ignore_words: List of words to exclude from comparison
+            ignore_words: Words to exclude from comparison (list or set)
         """
         self.normalizer = TextNormalizer(ignore_words)
         self.records: List[BPRecord] = []
         self.normalized_names: Dict[str, str] = {}  # bp_number -> normalized name
+        self._names: List[str] = []  # normalized name per record, aligned with records
+        self._bp_ids = np.empty(0, dtype=np.int64)  # integer id per record (see load_records)
 
     def load_records(self, data: List[Dict[str, str]]) -> int:
         """
         Load BP records from a list of dictionaries.
 
         Args:
-            data: List of dicts with keys 'BP_Number', 'Name1', 'Name2'
+            data: List of dicts (or dict-like rows such as ExcelHandler's
+                  BPRow) with keys 'BP_Number', 'Name1', 'Name2'
 
         Returns:
             Number of records loaded
         """
-        self.records = []
-        self.normalized_names = {}
-
-        for row in data:
-            bp_number = str(row.get('BP_Number', '')).strip()
-            name1 = str(row.get('Name1', '')).strip()
-            name2 = str(row.get('Name2', '')).strip()
-
-            if not bp_number:
-                continue  # Skip records without BP number
+        # Read the three columns once each
+        bp_numbers = [str(row.get('BP_Number', '')).strip() for row in data]
+        name1s = [str(row.get('Name1', '')).strip() for row in data]
+        name2s = [str(row.get('Name2', '')).strip() for row in data]
+
+        self.records = [
+            BPRecord(bp_number=bp_number, name1=name1, name2=name2)
+            for bp_number, name1, name2 in zip(bp_numbers, name1s, name2s)
+            if bp_number  # Skip records without BP number
+        ]
+
+        # Pre-compute normalized names for efficiency (one batch call)
+        normalized = self.normalizer.normalize_many([r.combined_name for r in self.records])
+        self.normalized_names = {
+            record.bp_number: name for record, name in zip(self.records, normalized)
+        }
 
-            record = BPRecord(
-                bp_number=bp_number,
-                name1=name1,
-                name2=name2
-            )
-            self.records.append(record)
+        # Normalized name per record position for matching (looked up through
+        # the dict so duplicate BP numbers share a name, as before)
+        self._names = [self.normalized_names[r.bp_number] for r in self.records]
 
-            # Pre-compute normalized names for efficiency
-            self.normalized_names[bp_number] = self.normalizer.normalize(
-                record.combined_name
-            )
+        # Integer id per BP number so matching compares ints rather than
+        # strings to skip self-comparison (duplicate BP numbers share an id)
+        bp_index: Dict[str, int] = {}
+        self._bp_ids = np.array(
+            [bp_index.setdefault(r.bp_number, len(bp_index)) for r in self.records], dtype=np.int64
+        )
 
         return len(self.records)
 
@@ -213,7 +301,9 @@ class FuzzyMatcher:
         self,
         top_n: int = 3,
         min_score: float = 50.0,
-        progress_callback=None
+        progress_callback=None,
+        block_prefix: int = 0,
+        shared_word: bool = False
     ) -> Dict[str, List[MatchResult]]:
         """
         Find potential duplicate matches for all BP records.
@@ -222,45 +312,480 @@ class FuzzyMatcher:
             top_n: Number of top matches to return for each BP
             min_score: Minimum similarity score to consider as a match
             progress_callback: Optional callback function(current, total) for progress updates
+            block_prefix: If > 0, only compare records whose normalized names
+                          start with the same block_prefix characters. Much
+                          faster on large files, but misses matches that
+                          differ in their first characters.
+            shared_word: If True, only compare records whose normalized names
+                         have at least one word in common. Faster on large
+                         files, but misses matches that differ in every word.
+                         Groups where many names share a word are compared
+                         in full, which is no slower than block_prefix=0.
 
         Returns:
             Dictionary mapping BP_Number to list of MatchResults
         """
+        records = self.records
+        total = len(records)
+        if not total:
+            return {}
+
+        if top_n <= 0:
+            return {record.bp_number: [] for record in records}
+
+        # Scores are never negative, so any lower threshold acts as 0. This also
+        # keeps the -1 self-comparison marker below the threshold.
+        min_score = max(min_score, 0.0)
+
+        names = self._names
+        ids = self._bp_ids
+        empty = np.array([not name for name in names])
+
+        # (match indexes, scores) per record, best first
+        top: List[Tuple[List[int], List[float]]] = [None] * total
+
+        # Records settled as exact duplicates are not scored at all
+        active = np.ones(total, dtype=bool)
+        if min_score <= 100:
+            self._settle_exact_duplicates(names, ids, top_n, top, active)
+        active_idx = np.flatnonzero(active)
+
+        # Records are only compared within their group
+        if block_prefix > 0:
+            buckets: Dict[str, List[int]] = {}
+            for idx in active_idx.tolist():
+                buckets.setdefault(names[idx][:block_prefix], []).append(idx)
+            groups = [np.array(bucket) for bucket in buckets.values()]
+        else:
+            groups = [active_idx]
+
+        match_group = self._match_group_pairs if shared_word else self._match_group
+
+        done = total - len(active_idx)
+        for group in groups:
+            for finished in match_group(group, names, ids, empty, top_n, min_score, top):
+                # Report progress
+                done += finished
+                if progress_callback:
+                    progress_callback(done, total)
+
         results: Dict[str, List[MatchResult]] = {}
-        total = len(self.records)
+        for source, (match_idx, match_scores) in zip(records, top):
+            results[source.bp_number] = [
+                MatchResult(
+                    source_bp=source,
+                    match_bp=records[j],
+                    similarity_score=score
+                )
+                for j, score in zip(match_idx, match_scores)
+            ]
 
-        for idx, source in enumerate(self.records):
-            source_normalized = self.normalized_names.get(source.bp_number, '')
-            matches: List[MatchResult] = []
+        return results
 
-            # Compare with all other records
-            for target in self.records:
-                # Skip self-comparison
-                if source.bp_number == target.bp_number:
-                    continue
+    @staticmethod
+    def _settle_exact_duplicates(
+        names: List[str],
+        ids: np.ndarray,
+        top_n: int,
+        top: List[Tuple[List[int], List[float]]],
+        active: np.ndarray
+    ):
+        """
+        Settle the top matches of records in large groups of identical names.
 
-                target_normalized = self.normalized_names.get(target.bp_number, '')
+        Only identical non-empty names score 100, the maximum, so a record's
+        top matches start with the other members of its identical-name group
+        in record order. Keeping the first top_n + 1 members with a unique BP
+        number (and every member with a duplicate one) is enough for any
+        record's top-N, so the remaining members are never scored. Their own
+        top-N is the first top_n members of the group.
 
-                # Calculate similarity
-                score = self.calculate_similarity(source_normalized, target_normalized)
+        Args:
+            names: Normalized name per record
+            ids: Integer BP number id per record
+            top_n: Number of top matches to keep for each record
+            top: Output list, set to (match indexes, scores) per settled record
+            active: Record mask, cleared for settled records
+        """
+        members_by_name: Dict[str, List[int]] = {}
+        for idx, name in enumerate(names):
+            if name:
+                members_by_name.setdefault(name, []).append(idx)
 
-                # Only include if above minimum threshold
-                if score >= min_score:
-                    matches.append(MatchResult(
-                        source_bp=source,
-                        match_bp=target,
-                        similarity_score=score
-                    ))
+        unique_id = (np.bincount(ids) == 1)[ids]
 
-            # Sort by similarity score (descending) and take top N
-            matches.sort(key=lambda x: x.similarity_score, reverse=True)
-            results[source.bp_number] = matches[:top_n]
+        for members in members_by_name.values():
+            if len(members) <= top_n + 1:
+                continue
 
-            # Report progress
-            if progress_callback:
-                progress_callback(idx + 1, total)
+            unique_members = [idx for idx in members if unique_id[idx]]
+            for idx in unique_members[top_n + 1:]:
+                top[idx] = (members[:top_n], [100.0] * top_n)
+                active[idx] = False
 
-        return results
+    def _match_group(
+        self,
+        group: np.ndarray,
+        names: List[str],
+        ids: np.ndarray,
+        empty: np.ndarray,
+        top_n: int,
+        min_score: float,
+        top: List[Tuple[List[int], List[float]]]
+    ):
+        """
+        Score a group of records against each other and store their top matches.
+
+        Yields the number of records finished after each block of rows.
+
+        Args:
+            group: Record indexes of the group
+            names: Normalized name per record
+            ids: Integer BP number id per record
+            empty: True for records with an empty normalized name
+            top_n: Number of top matches to keep for each record
+            min_score: Minimum similarity score to consider as a match
+            top: Output list, set to (match indexes, scores) per record
+        """
+        total = len(names)
+        size = len(group)
+
+        # Process the group shortest name first so the names each block can
+        # still match (see _length_factor) are one contiguous column range.
+        # Results do not depend on the order: keys carry the record index.
+        length_factor = self._length_factor(min_score)
+        if length_factor is not None:
+            lengths = np.array([len(names[idx]) for idx in group])
+            order = np.argsort(lengths, kind='stable')
+            group, lengths = group[order], lengths[order]
+
+        group_names = [names[idx] for idx in group]
+        group_names_arr = np.array(group_names, dtype=object)
+
+        # Normalized names are single-space separated lowercase words, so
+        # token_sort_ratio equals ratio on the names with their words sorted.
+        # Sorting once per name here saves re-tokenizing them for every pair.
+        sorted_names = [' '.join(sorted(name.split())) for name in group_names]
+        group_ids = ids[group]
+        group_empty = empty[group]
+
+        # Running top-N per record as packed int64 keys (see _pack_keys);
+        # -1 marks an empty slot
+        best = np.full((size, top_n), -1, dtype=np.int64)
+
+        # The score matrix is symmetric, so each block of source rows is only
+        # scored against itself and the records after it (upper triangle).
+        # The mirrored half is folded into the later records' running top-N.
+        # rapidfuzz computes the matrices in C++ across all cores (workers=-1)
+        # without holding the GIL
+        block = max(1, self.BLOCK_CELLS // size)
+
+        for start in range(0, size, block):
+            stop = min(start + block, size)
+
+            # Names longer than this can not reach min_score with any row of the block
+            end = size
+            if length_factor is not None:
+                end = max(stop, int(np.searchsorted(lengths, lengths[stop - 1] * length_factor, side='right')))
+
+            queries = group_names[start:stop]
+            choices = group_names[start:end]
+
+            token_sort = process.cdist(sorted_names[start:stop], sorted_names[start:end], scorer=fuzz.ratio,
+                                       dtype=np.float64, workers=-1)
+            simple_ratio = process.cdist(queries, choices, scorer=fuzz.ratio,
+                                         dtype=np.float64, workers=-1)
+
+            # token_set_ratio is the slowest scorer and adds at most 40 points,
+            # so only pairs that could still reach min_score need it. The 0.01
+            # margin keeps pairs whose total would round up to min_score.
+            needed = token_sort * 0.4 + simple_ratio * 0.2 >= min_score - 0.01 - 40
+            # token_set_ratio is symmetric, so pairs of two rows of this
+            # block are scored once and copied to the mirrored cell
+            rows, cols = np.nonzero(needed)
+            upper = cols >= rows
+            rows, cols = rows[upper], cols[upper]
+            if len(rows) <= needed.size * self.PAIRWISE_MAX_FRACTION:
+                # Pairs left at 0 stay below min_score either way
+                token_set = np.zeros_like(token_sort)
+                if len(rows):
+                    values = process.cpdist(
+                        group_names_arr[start + rows], group_names_arr[start + cols],
+                        scorer=fuzz.token_set_ratio, dtype=np.float64, workers=-1
+                    )
+                    token_set[rows, cols] = values
+                    inside = cols < stop - start
+                    token_set[cols[inside], rows[inside]] = values[inside]
+            else:
+                token_set = process.cdist(queries, choices, scorer=fuzz.token_set_ratio,
+                                          dtype=np.float64, workers=-1)
+
+            # Same weighting as calculate_similarity
+            scores = np.round(token_sort * 0.4 + token_set * 0.4 + simple_ratio * 0.2, 2)
+
+            # Empty names never match; skip self-comparison
+            scores[:, group_empty[start:end]] = 0.0
+            scores[group_empty[start:stop], :] = 0.0
+            scores[group_ids[start:stop, None] == group_ids[None, start:end]] = -1.0
+
+            passed_rows, passed_cols = np.nonzero(scores >= min_score)
+            if len(passed_rows) <= scores.size * self.SPARSE_MAX_FRACTION:
+                # Few pairs pass: fold just those into the running top-N of
+                # the block's rows and, mirrored, of the later records in
+                # one pass, instead of packing and partitioning every cell
+                later = passed_cols >= stop - start
+                positions = np.concatenate((passed_rows, passed_cols[later]))
+                matched = np.concatenate((passed_cols, passed_rows[later]))
+                values = scores[passed_rows, passed_cols]
+                keys = self._pack_keys(np.concatenate((values, values[later])), group[start + matched],
+                                       total, min_score)
+                best[start:end] = self._merge_top_keys(best[start:end], positions, keys, top_n)
+            else:
+                keys = self._pack_keys(scores, group[start:end], total, min_score)
+
+                # Rows of this block are complete: earlier records were folded in
+                # by previous blocks, later ones are in this block's columns
+                best[start:stop] = self._top_keys(np.concatenate((best[start:stop], keys), axis=1), top_n)
+
+                # Mirror this block into the running top-N of the later records
+                if stop < end:
+                    mirrored = self._pack_keys(scores[:, stop - start:].T, group[start:stop], total, min_score)
+                    best[stop:end] = self._top_keys(np.concatenate((best[stop:end], mirrored), axis=1), top_n)
+
+            self._store_top_keys(best[start:stop], group[start:stop], total, top)
+
+            yield stop - start
+
+    def _match_group_pairs(
+        self,
+        group: np.ndarray,
+        names: List[str],
+        ids: np.ndarray,
+        empty: np.ndarray,
+        top_n: int,
+        min_score: float,
+        top: List[Tuple[List[int], List[float]]]
+    ):
+        """
+        Score the records of a group that share a word and store their top matches.
+
+        Same arguments and yields as _match_group, but pairs are taken from an
+        inverted word index and scored one by one (cpdist), so pairs without
+        a common word are never scored. Empty names have no words and never
+        match. When so many pairs share a word that this would cost more
+        (see SHARED_WORD_MAX_FRACTION), the whole group is scored by
+        _match_group instead.
+        """
+        total = len(names)
+        size = len(group)
+        group_names = np.array([names[idx] for idx in group], dtype=object)
+
+        # Inverted index: one (word, position) entry per distinct word of each
+        # name, sorted by word then position, so each word's postings are a
+        # contiguous ascending run
+        word_ids: Dict[str, int] = {}
+        entry_words = []
+        entry_positions = []
+        for pos, name in enumerate(group_names):
+            for word in set(name.split()):
+                entry_words.append(word_ids.setdefault(word, len(word_ids)))
+                entry_positions.append(pos)
+        entry_words = np.array(entry_words, dtype=np.int64)
+        order = np.lexsort((entry_positions, entry_words))
+        postings = np.array(entry_positions, dtype=np.int64)[order]
+
+        # Each entry pairs with the later entries of the same word
+        posting_ends = np.cumsum(np.bincount(entry_words, minlength=len(word_ids)))
+        partners = posting_ends[entry_words[order]] - np.arange(len(postings)) - 1
+
+        # partners.sum() counts pairs sharing several words more than once,
+        # so this errs towards the whole-group scoring
+        if partners.sum() > self.SHARED_WORD_MAX_FRACTION * size * (size - 1) / 2:
+            yield from self._match_group(group, names, ids, empty, top_n, min_score, top)
+            return
+
+        sorted_names = np.array([' '.join(sorted(name.split())) for name in group_names], dtype=object)
+        lengths = np.array([len(name) for name in group_names])
+        length_factor = self._length_factor(min_score)
+
+        # Entries by source position, and the number of pairs each position starts
+        by_position = np.argsort(postings, kind='stable')
+        position_bounds = np.searchsorted(postings[by_position], np.arange(size + 1))
+        pair_ends = np.cumsum(np.bincount(postings, weights=partners, minlength=size))
+
+        # Running top-N per record as packed int64 keys (see _pack_keys)
+        best = np.full((size, top_n), -1, dtype=np.int64)
+
+        # Pairs are generated and scored for one block of source positions at
+        # a time, at most about BLOCK_PAIRS pairs. Every pair is generated by
+        # its first (lower) position, so after a block its records are done.
+        start = 0
+        while start < size:
+            pairs_before = pair_ends[start - 1] if start else 0
+            stop = int(np.searchsorted(pair_ends, pairs_before + self.BLOCK_PAIRS, side='right'))
+            stop = min(max(stop, start + 1), size)
+
+            # Each entry of the block pairs with the entries after it in its
+            # word's run, gathered as one flat index range per entry
+            entries = by_position[position_bounds[start]:position_bounds[stop]]
+            counts = partners[entries]
+            offsets = np.cumsum(counts) - counts
+            first = np.repeat(postings[entries], counts)
+            second = postings[np.arange(counts.sum()) + np.repeat(entries + 1 - offsets, counts)]
+
+            # Pairs sharing several words are scored once (sorting beats
+            # np.unique's hashing on these int64 codes)
+            codes = np.sort(first * size + second)
+            codes = codes[np.diff(codes, prepend=-1) != 0]
+            first, second = np.divmod(codes, size)
+
+            # Skip self-comparison, and pairs whose lengths rule out min_score
+            keep = ids[group[first]] != ids[group[second]]
+            if length_factor is not None:
+                first_len, second_len = lengths[first], lengths[second]
+                keep &= np.maximum(first_len, second_len) <= np.minimum(first_len, second_len) * length_factor
+            first, second = first[keep], second[keep]
+
+            if len(first):
+                # Same components and weighting as _match_group
+                token_sort = process.cpdist(sorted_names[first], sorted_names[second], scorer=fuzz.ratio,
+                                            dtype=np.float64, workers=-1)
+                simple_ratio = process.cpdist(group_names[first], group_names[second], scorer=fuzz.ratio,
+                                              dtype=np.float64, workers=-1)
+
+                # As in _match_group, token_set_ratio only for the pairs that
+                # could still reach min_score
+                needed = token_sort * 0.4 + simple_ratio * 0.2 >= min_score - 0.01 - 40
+                token_set = np.zeros_like(token_sort)
+                if needed.any():
+                    token_set[needed] = process.cpdist(
+                        group_names[first[needed]], group_names[second[needed]],
+                        scorer=fuzz.token_set_ratio, dtype=np.float64, workers=-1
+                    )
+                scores = np.round(token_sort * 0.4 + token_set * 0.4 + simple_ratio * 0.2, 2)
+
+                # Fold passing pairs into the running top-N, in both directions
+                passed = scores >= min_score
+                first, second, scores = first[passed], second[passed], scores[passed]
+                keys = self._pack_keys(np.concatenate((scores, scores)),
+                                       group[np.concatenate((second, first))], total, min_score)
+                best = self._merge_top_keys(best, np.concatenate((first, second)), keys, top_n)
+
+            self._store_top_keys(best[start:stop], group[start:stop], total, top)
+            yield stop - start
+            start = stop
+
+    @staticmethod
+    def _length_factor(min_score: float) -> Optional[float]:
+        """
+        Largest length ratio two names can have and still reach min_score.
+
+        ratio (and token_sort_ratio, which compares names of the same
+        lengths) is at most 200 * shorter / (shorter + longer), while
+        token_set_ratio can still be 100. A pair therefore needs
+        0.6 * that bound + 40 >= min_score (less the 0.01 rounding margin),
+        i.e. longer <= shorter * factor.
+
+        Args:
+            min_score: Minimum similarity score to consider as a match
+
+        Returns:
+            The factor, or None if any lengths can still match
+        """
+        needed = min_score - 0.01 - 40
+        if needed <= 0:
+            return None
+        # Tiny slack so float error never drops a pair exactly on the bound
+        return 120 / needed - 1 + 1e-9
+
+    @staticmethod
+    def _pack_keys(scores: np.ndarray, cols: np.ndarray, total: int, min_score: float) -> np.ndarray:
+        """
+        Pack scores and record indexes into sortable int64 keys.
+
+        A larger key means a higher score, or the same score with a lower
+        record index, so sorting keys descending gives best-first order with
+        ties in record order. Scores below min_score become -1.
+
+        Args:
+            scores: Score matrix rounded to 2 decimals (rows x len(cols))
+            cols: Record index of each score column
+            total: Number of records
+            min_score: Minimum similarity score to keep
+
+        Returns:
+            Key matrix with the same shape as scores
+        """
+        # Offset by 100 so the -1 self-comparison score still packs >= 0
+        centi = np.rint(scores * 100).astype(np.int64) + 100
+        keys = centi * (total + 1) + (total - cols)
+        keys[scores < min_score] = -1
+        return keys
+
+    @staticmethod
+    def _merge_top_keys(best: np.ndarray, rows: np.ndarray, keys: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Fold scattered keys into a running top-N key matrix.
+
+        Args:
+            best: Running top-N keys per row (rows x top_n), -1 for empty slots
+            rows: Row of each new key
+            keys: New keys, all valid (>= 0)
+            top_n: Number of keys to keep per row
+
+        Returns:
+            Updated key matrix with the same shape as best
+        """
+        kept_rows, kept_slots = np.nonzero(best >= 0)
+        rows = np.concatenate((kept_rows, rows))
+        keys = np.concatenate((best[kept_rows, kept_slots], keys))
+
+        # Best first per row, then keep the first top_n of each
+        order = np.lexsort((-keys, rows))
+        rows, keys = rows[order], keys[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        first_top = rank < top_n
+
+        merged = np.full_like(best, -1)
+        merged[rows[first_top], rank[first_top]] = keys[first_top]
+        return merged
+
+    @staticmethod
+    def _store_top_keys(keys: np.ndarray, records: np.ndarray, total: int,
+                        top: List[Tuple[List[int], List[float]]]):
+        """
+        Decode finished top-N keys into (match indexes, scores), best first.
+
+        Args:
+            keys: Top-N keys per record (see _pack_keys), -1 for empty slots
+            records: Record index of each row of keys
+            total: Number of records
+            top: Output list, set to (match indexes, scores) per record
+        """
+        # Only the top_n survivors are sorted, for all rows at once
+        finished = -np.sort(-keys, axis=1)
+        counts = (finished >= 0).sum(axis=1).tolist()
+        match_idx = (total - finished % (total + 1)).tolist()
+        match_scores = ((finished // (total + 1) - 100) / 100).tolist()
+
+        for row, count, idx_row, score_row in zip(records.tolist(), counts, match_idx, match_scores):
+            top[row] = (idx_row[:count], score_row[:count])
+
+    @staticmethod
+    def _top_keys(keys: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Keep the top_n largest keys of each row (unordered).
+
+        Args:
+            keys: Key matrix with at least top_n columns
+            top_n: Number of keys to keep per row
+
+        Returns:
+            Key matrix with top_n columns
+        """
+        if keys.shape[1] > top_n:
+            keys = np.partition(keys, keys.shape[1] - top_n, axis=1)[:, -top_n:]
+        return keys
 
     def get_summary_stats(self, results: Dict[str, List[MatchResult]]) -> Dict:
         """
@@ -275,29 +800,22 @@ class FuzzyMatcher:
         total_records = len(self.records)
         records_with_matches = sum(1 for matches in results.values() if matches)
 
-        all_scores = []
-        high_confidence_count = 0  # Score >= 80
-        medium_confidence_count = 0  # Score 60-79
-        low_confidence_count = 0  # Score < 60
-
-        for matches in results.values():
-            for match in matches:
-                score = match.similarity_score
-                all_scores.append(score)
+        scores = np.fromiter(
+            (match.similarity_score for matches in results.values() for match in matches),
+            dtype=np.float64
+        )
 
-                if score >= 80:
-                    high_confidence_count += 1
-                elif score >= 60:
-                    medium_confidence_count += 1
-                else:
-                    low_confidence_count += 1
+        # Matches per confidence level: Score < 60, 60-79, >= 80
+        low_confidence_count, medium_confidence_count, high_confidence_count = (
+            np.bincount(np.digitize(scores, (60, 80)), minlength=3).tolist()
+        )
 
-        avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
+        avg_score = float(scores.mean()) if len(scores) else 0
 
         return {
             'total_records': total_records,
             'records_with_matches': records_with_matches,
-            'total_matches': len(all_scores),
+            'total_matches': len(scores),
             'average_score': round(avg_score, 2),
             'high_confidence': high_confidence_count,
             'medium_confidence': medium_confidence_count,
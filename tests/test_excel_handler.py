@@ -0,0 +1,210 @@
+"""
+Tests for the Excel file handler.
+
+Input files are built with openpyxl in a temporary directory; the
+<dimension> tag of the sheet XML is rewritten to mimic writers that
+leave it stale. Results are exported with both writers and read back.
+
+Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from openpyxl import Workbook, load_workbook
+
+from src import excel_handler
+from src.excel_handler import ExcelHandler, BPRow
+from src.matching_engine import BPRecord, MatchResult
+
+
+HEADER = ['BP_Number', 'Name1', 'Name2']
+
+RESULT_HEADERS = (
+    'Source BP Number', 'Source Name1', 'Source Name2', 'Match Rank', 'Match BP Number',
+    'Match Name1', 'Match Name2', 'Similarity Score', 'Confidence Level',
+)
+
+SUMMARY_STATS = {
+    'total_records': 4, 'records_with_matches': 3, 'total_matches': 4, 'average_score': 76.25,
+    'high_confidence': 2, 'medium_confidence': 1, 'low_confidence': 1,
+}
+
+
+class ExcelTestCase(unittest.TestCase):
+    """Temporary directory and input-file helpers."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_input(self, rows, name='input.xlsx', dimension=None) -> str:
+        """Write rows to an .xlsx file, optionally forcing the sheet's <dimension> ref."""
+        path = os.path.join(self.tmp, name)
+        wb = Workbook()
+        for row in rows:
+            wb.active.append(row)
+        wb.save(path)
+
+        if dimension is not None:
+            patched = path + '.tmp'
+            with zipfile.ZipFile(path) as src, zipfile.ZipFile(patched, 'w') as dst:
+                for item in src.infolist():
+                    data = src.read(item.filename)
+                    if item.filename == 'xl/worksheets/sheet1.xml':
+                        data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="%s"' % dimension.encode(), data)
+                    dst.writestr(item, data)
+            os.replace(patched, path)
+        return path
+
+
+class LoadTest(ExcelTestCase):
+    """validate_file(), load_data() and open_and_load()."""
+
+    def data_rows(self, count):
+        return [[f'BP{i:03}', f'Name {i}', ''] for i in range(1, count + 1)]
+
+    def test_load(self):
+        path = self.write_input([HEADER] + self.data_rows(2))
+        records, message = ExcelHandler.load_data(path)
+        self.assertEqual(records, [('BP001', 'Name 1', ''), ('BP002', 'Name 2', '')])
+        self.assertEqual(message, 'Loaded 2 records successfully')
+        self.assertEqual(ExcelHandler.open_and_load(path), (True, message, records))
+        self.assertEqual(ExcelHandler.validate_file(path), (True, 'File validated successfully'))
+
+    def test_header_case_spaces_and_order(self):
+        path = self.write_input([[' name2 ', 'Extra', 'BP_NUMBER', 'name1'], ['N2', 'x', 'BP1', None], [None] * 4])
+        # Empty cells load as '', completely empty rows are skipped
+        records = [('BP1', '', 'N2')]
+        self.assertEqual(ExcelHandler.load_data(path)[0], records)
+        self.assertEqual(ExcelHandler.open_and_load(path), (True, 'Loaded 1 records successfully', records))
+        self.assertTrue(ExcelHandler.validate_file(path)[0])
+
+    def test_missing_columns(self):
+        path = self.write_input([['BP_Number', 'Name 1'], ['BP1', 'A']])
+        expected = 'Missing required columns: Name1, Name2'
+        self.assertEqual(ExcelHandler.validate_file(path), (False, expected))
+        self.assertEqual(ExcelHandler.open_and_load(path), (False, expected, []))
+
+    def test_header_only(self):
+        path = self.write_input([HEADER])
+        self.assertEqual(ExcelHandler.load_data(path), ([], 'Loaded 0 records successfully'))
+        self.assertEqual(ExcelHandler.open_and_load(path), (True, 'Loaded 0 records successfully', []))
+
+    def test_stale_dimension(self):
+        # Declares 5 rows; all 50 data rows must still load
+        path = self.write_input([HEADER] + self.data_rows(50), dimension='A1:C5')
+        self.assertEqual(len(ExcelHandler.load_data(path)[0]), 50)
+        is_valid, message, records = ExcelHandler.open_and_load(path)
+        self.assertEqual((is_valid, message, len(records)), (True, 'Loaded 50 records successfully', 50))
+
+    def test_a1_dimension(self):
+        # Declares a single cell; the header must still be read in full
+        path = self.write_input([HEADER] + self.data_rows(4), dimension='A1')
+        self.assertEqual(ExcelHandler.validate_file(path), (True, 'File validated successfully'))
+        self.assertEqual(ExcelHandler.load_data(path)[0][3], ('BP004', 'Name 4', ''))
+        self.assertEqual(len(ExcelHandler.open_and_load(path)[2]), 4)
+
+    def test_bad_files(self):
+        self.assertFalse(ExcelHandler.open_and_load(os.path.join(self.tmp, 'missing.xlsx'))[0])
+
+        text = os.path.join(self.tmp, 'input.csv')
+        with open(text, 'w') as f:
+            f.write('BP_Number,Name1,Name2\n')
+        self.assertEqual(ExcelHandler.open_and_load(text)[:2], (False, 'File must be an Excel file (.xlsx or .xls)'))
+
+        corrupt = os.path.join(self.tmp, 'corrupt.xlsx')
+        with open(corrupt, 'w') as f:
+            f.write('not a zip file')
+        is_valid, message, records = ExcelHandler.open_and_load(corrupt)
+        self.assertFalse(is_valid)
+        self.assertTrue(message.startswith('Error reading file'))
+
+
+class BPRowTest(unittest.TestCase):
+    """Dict-style access on loaded rows."""
+
+    def test_dict_style_access(self):
+        row = BPRow('BP1', 'Acme', '')
+        self.assertEqual((row['Name1'], row.get('Name1'), row.get('Other', '-')), ('Acme', 'Acme', '-'))
+        self.assertIn('BP_Number', row)
+        self.assertNotIn('BP1', row)
+        self.assertEqual(list(row.keys()), HEADER)
+        self.assertEqual(dict(row.items()), {'BP_Number': 'BP1', 'Name1': 'Acme', 'Name2': ''})
+        self.assertEqual(dict(row), dict(row.items()))
+        self.assertEqual((tuple(row), row[1]), (('BP1', 'Acme', ''), 'Acme'))
+        with self.assertRaises(KeyError):
+            row['Other']
+
+
+class ExportTest(ExcelTestCase):
+    """Both results writers produce the same workbook."""
+
+    def results(self):
+        acme = BPRecord('BP1', 'Acme', 'Ltd')
+        acme2 = BPRecord('BP2', 'ACME', '')
+        link = BPRecord('BP3', 'mailto:foo', '')
+        return {
+            'BP1': [MatchResult(acme, acme2, 92.5), MatchResult(acme, link, 55.0)],
+            'BP2': [MatchResult(acme2, acme, 92.5)],
+            'BP3': [MatchResult(link, acme, 65.0)],
+            'BP4': [],
+        }
+
+    def check_export(self, write):
+        path = os.path.join(self.tmp, 'out.xlsx')
+        write(self.results(), path, SUMMARY_STATS)
+
+        wb = load_workbook(path)
+        self.assertEqual(wb.sheetnames, ['Matching Results', 'Summary'])
+        ws = wb['Matching Results']
+        rows = list(ws.iter_rows(values_only=True))
+        self.assertEqual(rows, [
+            RESULT_HEADERS,
+            ('BP1', 'Acme', 'Ltd', 1, 'BP2', 'ACME', None, 92.5, 'High'),
+            ('BP1', 'Acme', 'Ltd', 2, 'BP3', 'mailto:foo', None, 55, 'Low'),
+            ('BP2', 'ACME', None, 1, 'BP1', 'Acme', 'Ltd', 92.5, 'High'),
+            ('BP3', 'mailto:foo', None, 1, 'BP1', 'Acme', 'Ltd', 65, 'Medium'),
+        ])
+
+        # URL-like names stay plain text
+        self.assertIsNone(ws['F3'].hyperlink)
+
+        # Score fill by confidence level; every result cell has a thin border
+        fills = [ws.cell(row, 8).fill for row in range(2, 6)]
+        self.assertEqual([fill.fgColor.rgb[-6:] if fill.fill_type else None for fill in fills],
+                         ['FF6B6B', None, 'FF6B6B', 'FFE066'])
+        for row in ws.iter_rows(min_row=1, max_row=5):
+            for cell in row:
+                self.assertEqual((cell.border.left.style, cell.border.bottom.style), ('thin', 'thin'))
+        self.assertEqual(ws['A1'].fill.fgColor.rgb[-6:], '4472C4')
+        self.assertTrue(ws['A1'].font.b)
+        self.assertEqual(ws.freeze_panes, 'A2')
+
+        summary = dict(wb['Summary'].iter_rows(min_row=4, values_only=True))
+        self.assertEqual(summary['Total Match Pairs Found'], 4)
+        self.assertEqual(summary['Average Similarity Score'], '76.25%')
+
+    def test_openpyxl_writer(self):
+        self.check_export(ExcelHandler._write_results_openpyxl)
+
+    @unittest.skipIf(excel_handler.xlsxwriter is None, 'xlsxwriter is not installed')
+    def test_xlsxwriter_writer(self):
+        self.check_export(ExcelHandler._write_results_xlsxwriter)
+
+    def test_export_results(self):
+        path = os.path.join(self.tmp, 'out.xlsx')
+        self.assertEqual(ExcelHandler.export_results(self.results(), path),
+                         (True, f'Results exported to: {path}'))
+        self.assertEqual(load_workbook(path)['Matching Results'].max_row, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
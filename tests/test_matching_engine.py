@@ -0,0 +1,177 @@
+"""
+Tests for the fuzzy matching engine.
+
+find_matches() is checked against a brute-force reference that scores
+every pair with calculate_similarity(), on random data that covers
+duplicate BP numbers, empty names and large groups of identical names.
+The block size and path-selection constants are overridden so that every
+scoring path runs.
+
+Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from src.matching_engine import FuzzyMatcher
+
+
+WORDS = [
+    'acme', 'global', 'trading', 'pacific', 'bank', 'tech', 'smith',
+    'jones', 'group', 'food', 'star', 'ocean', 'a', 'abc', 'abd',
+]
+
+IGNORE_WORDS = ['Ltd', 'Co']
+
+# Instance overrides of FuzzyMatcher's tuning constants: tiny blocks, and
+# each branch of the cdist/cpdist and dense/sparse choices forced on
+OVERRIDES = [
+    {},
+    {'BLOCK_CELLS': 97, 'PAIRWISE_MAX_FRACTION': 0.0, 'SPARSE_MAX_FRACTION': 0.0},
+    {'BLOCK_CELLS': 97, 'PAIRWISE_MAX_FRACTION': 1.0, 'SPARSE_MAX_FRACTION': 1.0},
+    {'BLOCK_CELLS': 1, 'PAIRWISE_MAX_FRACTION': 1.0, 'SPARSE_MAX_FRACTION': 0.0},
+]
+
+# (top_n, min_score) combinations, including thresholds where length
+# pruning, exact-duplicate settling and the negative clamp apply
+SETTINGS = [(1, 50.0), (3, 0.0), (3, 65.5), (5, 85.0), (2, 100.0), (10, 40.0), (3, -5.0)]
+
+
+def make_data(size: int, seed: int):
+    """Random BP rows with duplicate BP numbers, empty names and repeated names."""
+    rng = random.Random(seed)
+    repeated = ['Acme Trading Co', 'Star Food', 'Bank']
+    data = []
+    for i in range(size):
+        choice = rng.random()
+        if choice < 0.25:
+            # Identical names, in groups larger than any tested top_n
+            name1 = rng.choice(repeated)
+        elif choice < 0.3:
+            # Empty after normalization
+            name1 = rng.choice(['', 'Ltd', '  ', '--'])
+        else:
+            name1 = ' '.join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 5)))
+        name2 = rng.choice(['', '', 'Ltd', 'Co.', 'Group', rng.choice(WORDS)])
+
+        # Some BP numbers appear on several rows
+        bp_number = f"BP{i if rng.random() < 0.85 else rng.randrange(size)}"
+        data.append({'BP_Number': bp_number, 'Name1': name1, 'Name2': name2})
+    return data
+
+
+def reference_matches(matcher: FuzzyMatcher, top_n: int, min_score: float, same_group=None):
+    """
+    Brute-force top matches, as (match BP number, score) lists per BP number.
+
+    Every record is scored against every record with another BP number;
+    ties keep record order. same_group(name, other_name) optionally
+    restricts the pairs.
+    """
+    records = matcher.records
+    names = [matcher.normalized_names[record.bp_number] for record in records]
+    results = {}
+    for i, source in enumerate(records):
+        candidates = []
+        for j, other in enumerate(records):
+            if source.bp_number == other.bp_number:
+                continue
+            if same_group is not None and not same_group(names[i], names[j]):
+                continue
+            score = matcher.calculate_similarity(names[i], names[j])
+            if score >= min_score:
+                candidates.append((-score, j))
+        candidates.sort()
+        results[source.bp_number] = [
+            (records[j].bp_number, -score) for score, j in candidates[:top_n]
+        ]
+    return results
+
+
+def as_pairs(results):
+    """Reduce find_matches() output to (match BP number, score) lists."""
+    return {
+        bp_number: [(match.match_bp.bp_number, match.similarity_score) for match in matches]
+        for bp_number, matches in results.items()
+    }
+
+
+class FindMatchesTest(unittest.TestCase):
+    """find_matches() against the brute-force reference."""
+
+    def make_matcher(self, data, **overrides) -> FuzzyMatcher:
+        matcher = FuzzyMatcher(IGNORE_WORDS)
+        for name, value in overrides.items():
+            setattr(matcher, name, value)
+        matcher.load_records(data)
+        return matcher
+
+    def test_all_pairs(self):
+        for seed in (1, 2):
+            data = make_data(120, seed)
+            reference = {}
+            for overrides in OVERRIDES:
+                matcher = self.make_matcher(data, **overrides)
+                for top_n, min_score in SETTINGS:
+                    if (top_n, min_score) not in reference:
+                        reference[top_n, min_score] = reference_matches(matcher, top_n, min_score)
+                    with self.subTest(seed=seed, overrides=overrides, top_n=top_n, min_score=min_score):
+                        self.assertEqual(
+                            as_pairs(matcher.find_matches(top_n, min_score)),
+                            reference[top_n, min_score]
+                        )
+
+    def test_block_prefix(self):
+        data = make_data(120, 3)
+        same_prefix = lambda a, b: a[:1] == b[:1]
+        for overrides in OVERRIDES[:2]:
+            matcher = self.make_matcher(data, **overrides)
+            for top_n, min_score in SETTINGS[:4]:
+                with self.subTest(overrides=overrides, top_n=top_n, min_score=min_score):
+                    self.assertEqual(
+                        as_pairs(matcher.find_matches(top_n, min_score, block_prefix=1)),
+                        reference_matches(matcher, top_n, min_score, same_prefix)
+                    )
+
+    def test_shared_word(self):
+        data = make_data(120, 4)
+        share_word = lambda a, b: bool(set(a.split()) & set(b.split()))
+        # Force pair-by-pair scoring, in one block and in tiny ones
+        for block_pairs in (250_000, 7, 1):
+            matcher = self.make_matcher(data, SHARED_WORD_MAX_FRACTION=1.0, BLOCK_PAIRS=block_pairs)
+            for top_n, min_score in SETTINGS:
+                with self.subTest(block_pairs=block_pairs, top_n=top_n, min_score=min_score):
+                    self.assertEqual(
+                        as_pairs(matcher.find_matches(top_n, min_score, shared_word=True)),
+                        reference_matches(matcher, top_n, min_score, share_word)
+                    )
+
+    def test_shared_word_falls_back_to_all_pairs(self):
+        data = make_data(120, 5)
+        matcher = self.make_matcher(data, SHARED_WORD_MAX_FRACTION=0.0)
+        for top_n, min_score in SETTINGS[:3]:
+            with self.subTest(top_n=top_n, min_score=min_score):
+                self.assertEqual(
+                    as_pairs(matcher.find_matches(top_n, min_score, shared_word=True)),
+                    as_pairs(matcher.find_matches(top_n, min_score))
+                )
+
+    def test_no_self_matches_for_negative_threshold(self):
+        matcher = self.make_matcher([
+            {'BP_Number': '1', 'Name1': 'Acme', 'Name2': ''},
+            {'BP_Number': '1', 'Name1': 'Acme', 'Name2': 'Trading'},
+            {'BP_Number': '2', 'Name1': 'Star', 'Name2': ''},
+        ])
+        results = as_pairs(matcher.find_matches(3, -5))
+        self.assertEqual(results, as_pairs(matcher.find_matches(3, 0)))
+        self.assertNotIn('1', [bp_number for bp_number, score in results['1']])
+
+    def test_empty_input_and_zero_top_n(self):
+        self.assertEqual(FuzzyMatcher().find_matches(), {})
+        matcher = self.make_matcher(make_data(10, 6))
+        self.assertTrue(all(matches == [] for matches in matcher.find_matches(0).values()))
+
+
+if __name__ == '__main__':
+    unittest.main()